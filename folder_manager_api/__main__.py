@@ -1,10 +1,38 @@
 # __main__.py
 
-import uvicorn
-from .folder_manager_api import app
+import os
+import sys
+from .folder_manager_api import port
 
 def main():
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # os.cpu_count() returns None when the count can't be determined
+    workers = os.cpu_count() or 1
+
+    if sys.platform == "win32":
+        # gunicorn is Unix-only; let uvicorn manage one worker per core itself
+        import uvicorn
+        uvicorn.run(
+            "folder_manager_api.folder_manager_api:app",
+            host="0.0.0.0",
+            port=port,
+            loop="auto",
+            http="httptools",
+            workers=workers,
+            log_level="warning",
+            access_log=False,
+        )
+        return
+
+    # Hand the process over to gunicorn, running one uvicorn worker per core;
+    # UvicornWorker picks up uvloop and httptools when they are installed
+    os.execvp(sys.executable, [
+        sys.executable, "-m", "gunicorn",
+        "folder_manager_api.folder_manager_api:app",
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", str(workers),
+        "-b", f"0.0.0.0:{port}",
+        "--log-level", "warning",
+    ])
 
 if __name__ == "__main__":
     main()
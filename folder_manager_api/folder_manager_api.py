@@ -1,13 +1,24 @@
 import os
+import asyncio
+import anyio
 import configparser
+import json
+import tempfile
 import logging
 from logging.handlers import RotatingFileHandler
-from fastapi import FastAPI, HTTPException, Depends, Request, Response
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from pydantic import BaseModel
-from typing import Optional, List
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Response
+from fastapi.routing import APIRoute
+from typing import List
 from folder_manager import Folder, FolderError
+from .models import PathOperation, FileOperation, ExtensionOperation, CreateFileBody, BatchOp
+import msgspec
+import orjson
 import secrets
+import base64
+from functools import lru_cache
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse, StreamingResponse
 from datetime import datetime, timedelta
@@ -25,12 +36,65 @@ if not os.path.exists(config_file):
     with open(config_file, 'w') as configfile:
         config.write(configfile)
 
-# Read the configuration file
-config.read(config_file)
-port = int(config['server']['port'])
-username = config['auth']['username']
-password = config['auth']['password']
-log_size = int(config['logging'].get('log_size', 1073741824))  # Default to 1GB if not set
+# Values parsed from the config file, with the type each must have
+settings_types = {'port': int, 'username': str, 'password': str, 'log_size': int}
+
+def config_source(path):
+    # Identifies one exact version of the config file; any edit, rename or
+    # replacement (even one that preserves an older mtime) changes it
+    stat = os.stat(path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'ino': stat.st_ino}
+
+# Parse the config file, reusing the values an earlier process (e.g. another
+# gunicorn worker) cached for this exact version of it. The cache holds the
+# credentials, so it is only ever readable by its owner.
+def load_settings(config_file, config_cache):
+    source = config_source(config_file)
+
+    # A cache left readable by others (e.g. by an older release) is rebuilt
+    if os.path.exists(config_cache) and (os.name == 'nt' or not os.stat(config_cache).st_mode & 0o077):
+        try:
+            with open(config_cache) as cachefile:
+                cached = json.load(cachefile)
+        except (OSError, ValueError):
+            cached = None
+        # Anything but the exact expected shape falls back to parsing the config
+        if (isinstance(cached, dict) and cached.get('source') == source
+                and isinstance(cached.get('settings'), dict)
+                and all(isinstance(cached['settings'].get(key), kind) for key, kind in settings_types.items())):
+            return cached['settings']
+
+    parser = configparser.ConfigParser()
+    parser.read(config_file)
+    settings = {
+        'port': int(parser['server']['port']),
+        'username': parser['auth']['username'],
+        'password': parser['auth']['password'],
+        'log_size': int(parser['logging'].get('log_size', 1073741824)),  # Default to 1GB if not set
+    }
+
+    # Write to a private temporary file and rename it into place, so
+    # concurrent workers never see a partially written cache
+    try:
+        fd, tmp_cache = tempfile.mkstemp(prefix=os.path.basename(config_cache) + '.', dir=os.path.dirname(os.path.abspath(config_cache)))
+        try:
+            with os.fdopen(fd, 'w') as cachefile:
+                json.dump({'source': source, 'settings': settings}, cachefile)
+            os.replace(tmp_cache, config_cache)
+        except OSError:
+            os.unlink(tmp_cache)
+            raise
+    except OSError:
+        pass
+    return settings
+
+config_cache = config_file + '.cache'
+settings = load_settings(config_file, config_cache)
+
+port = settings['port']
+username = settings['username']
+password = settings['password']
+log_size = settings['log_size']
 
 # Configure logging
 log_file = "folder_manager_api.log"
@@ -44,53 +108,131 @@ if not any(isinstance(h, RotatingFileHandler) for h in logger.handlers):
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 
+# Request tracing is handled by LoggingMiddleware at DEBUG level
+logging.getLogger("uvicorn.access").disabled = True
+
+# fastapi.responses.ORJSONResponse is deprecated in recent FastAPI releases,
+# so keep our own orjson-backed response class
+class ORJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+# Nearly every endpoint is a blocking filesystem call run off the event loop,
+# so give both the executor used by the handlers and Starlette's threadpool
+# far more room than their defaults
+fs_threads = 200
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = fs_threads
+    pool = ThreadPoolExecutor(max_workers=fs_threads, thread_name_prefix="fs")
+    asyncio.get_running_loop().set_default_executor(pool)
+    yield
+    pool.shutdown(wait=False)
+
 # Initialize the FastAPI app with metadata
 app = FastAPI(
     title="Folder Manager API",
     description="This API allows managing folders and files, including creating, listing, counting, and deleting files and folders.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+    redirect_slashes=False,
 )
 
 # Capture the start time
 start_time = datetime.now()
 
-security = HTTPBasic()
-
-def get_current_username(credentials: HTTPBasicCredentials = Depends(security)):
-    correct_username = secrets.compare_digest(credentials.username, username)
-    correct_password = secrets.compare_digest(credentials.password, password)
-    if not (correct_username and correct_password):
+# Folder only holds the normalised path, so instances are safe to share
+# across requests and outlive the folder they point at
+@lru_cache(maxsize=2048)
+def _folder(path: str) -> Folder:
+    return Folder(path)
+
+# Short-lived cache of folder_exists/file_exists results, keyed on the
+# absolute path; mutating endpoints invalidate it through _invalidate_exists
+_exists_cache = TTLCache(maxsize=4096, ttl=1.0)
+_exists_generation = 0
+
+def _invalidate_exists(key=None):
+    # Drop one file entry, or everything when key is None: creating or
+    # removing a folder can change the answer for any path beneath or above
+    # it. Bumping the generation stops checks already in flight from storing
+    # a result read before the change.
+    global _exists_generation
+    _exists_generation += 1
+    if key is None:
+        _exists_cache.clear()
+    else:
+        _exists_cache.pop(key, None)
+
+# The only Basic credentials we accept, encoded once so each request is a
+# single constant-time comparison instead of a decode and split
+expected_credentials = base64.b64encode(f"{username}:{password}".encode())
+
+async def check_auth(request: Request):
+    # The auth scheme is case-insensitive (RFC 7617), the credentials are not
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "basic":
+        raise HTTPException(
+            status_code=401,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Basic"},
+        )
+    if not secrets.compare_digest(credentials.encode(), expected_credentials):
         raise HTTPException(
             status_code=401,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Basic"},
         )
-    return credentials.username
-
-class CreateFileRequest(BaseModel):
-    file_name: str
-    content: Optional[str] = ""
-
-class PathOperation(BaseModel):
-    path: str
-
-class FileOperation(BaseModel):
-    path: str
-    file_name: str
+    return username
+
+def _inline_refs(schema, defs):
+    # OpenAPI resolves "$ref" against the whole document, so msgspec's local
+    # "#/$defs/..." references are expanded in place
+    if isinstance(schema, dict):
+        if "$ref" in schema:
+            return _inline_refs(defs[schema["$ref"].rpartition("/")[2]], defs)
+        return {key: _inline_refs(value, defs) for key, value in schema.items() if key != "$defs"}
+    if isinstance(schema, list):
+        return [_inline_refs(value, defs) for value in schema]
+    return schema
+
+def json_body(model):
+    # Decode the raw body with a msgspec decoder built once per model; the
+    # returned dependency carries the matching OpenAPI requestBody
+    decoder = msgspec.json.Decoder(model)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+    schema = msgspec.json.schema(model)
+    decode.openapi_extra = {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_refs(schema, schema.get("$defs", {}))}},
+        }
+    }
+    return decode
 
-class ExtensionOperation(BaseModel):
-    path: str
-    extension: str
+path_body = json_body(PathOperation)
+file_body = json_body(FileOperation)
+extension_body = json_body(ExtensionOperation)
+create_file_body = json_body(CreateFileBody)
+batch_body = json_body(List[BatchOp])
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        logger.info(f"Request: {request.method} {request.url}")
+        # Skip all per-request logging work unless debug logging is on
+        if not logger.isEnabledFor(logging.DEBUG):
+            return await call_next(request)
+
+        logger.debug("Request: %s %s", request.method, request.url)
         if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.json()
-                logger.info(f"Request Body: {body}")
-            except Exception as e:
-                logger.info(f"Failed to parse request body: {e}")
+            logger.debug("Request Content-Length: %s", request.headers.get("content-length"))
 
         response = await call_next(request)
 
@@ -98,12 +240,15 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         async for chunk in response.body_iterator:
             response_body += chunk
 
-        logger.info(f"Response status: {response.status_code}")
-        logger.info(f"Response Body: {response_body.decode('utf-8')}")
+        logger.debug("Response status: %s", response.status_code)
+        logger.debug("Response Body: %s", response_body.decode('utf-8'))
 
         return StreamingResponse(iter([response_body]), status_code=response.status_code, headers=dict(response.headers))
 
-app.add_middleware(LoggingMiddleware)
+# Request tracing is opt-in so the middleware stays off the hot path
+if os.environ.get("LOG_REQUESTS"):
+    logger.setLevel(logging.DEBUG)
+    app.add_middleware(LoggingMiddleware)
 
 # Add CORS Middleware
 app.add_middleware(
@@ -114,7 +259,19 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
-@app.get("/")
+# Routes are registered on a router and included into the app below; paths
+# have no trailing slash and are not redirected
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Fixed response bodies are serialized once at import; handlers return them
+# as raw Responses so FastAPI's encoder is skipped entirely
+FOLDER_CREATED = orjson.dumps({"message": "Folder created successfully"})
+EXISTS = {True: orjson.dumps({"exists": True}), False: orjson.dumps({"exists": False})}
+
+def json_response(content: bytes) -> Response:
+    return Response(content, media_type="application/json")
+
+@router.get("/")
 def health_check():
     current_time = datetime.now()
     running_time = current_time - start_time
@@ -126,88 +283,201 @@ def health_check():
         "uptime": str(running_time)
     }
 
-@app.post("/create_folder/")
-def create_folder(operation: PathOperation, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
+@router.post("/create_folder", response_model=None, openapi_extra=path_body.openapi_extra)
+async def create_folder(username: str = Depends(check_auth), operation: PathOperation = Depends(path_body)):
+    folder = _folder(operation.path)
+    loop = asyncio.get_running_loop()
     try:
-        if folder.create_folder():
-            return {"message": "Folder created successfully"}
+        if await loop.run_in_executor(None, folder.create_folder):
+            return json_response(FOLDER_CREATED)
     except FolderError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        _invalidate_exists()
 
-@app.post("/list_files/")
-def list_files(operation: PathOperation, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
+@router.post("/list_files", response_model=None, openapi_extra=path_body.openapi_extra)
+async def list_files(username: str = Depends(check_auth), operation: PathOperation = Depends(path_body)):
+    folder = _folder(operation.path)
+    loop = asyncio.get_running_loop()
     try:
-        files = folder.list_files()
+        files = await loop.run_in_executor(None, folder.list_files)
         return {"files": files}
     except FolderError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/list_files_with_extension/")
-def list_files_with_extension(operation: ExtensionOperation, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
+@router.post("/list_files_with_extension", response_model=None, openapi_extra=extension_body.openapi_extra)
+async def list_files_with_extension(username: str = Depends(check_auth), operation: ExtensionOperation = Depends(extension_body)):
+    folder = _folder(operation.path)
+    loop = asyncio.get_running_loop()
     try:
-        files = folder.list_files_with_extension(operation.extension)
+        files = await loop.run_in_executor(None, folder.list_files_with_extension, operation.extension)
         return {"files": files}
     except FolderError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/count_files/")
-def count_files(operation: PathOperation, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
+@router.post("/count_files", response_model=None, openapi_extra=path_body.openapi_extra)
+async def count_files(username: str = Depends(check_auth), operation: PathOperation = Depends(path_body)):
+    folder = _folder(operation.path)
+    loop = asyncio.get_running_loop()
     try:
-        count = folder.count_files()
+        count = await loop.run_in_executor(None, folder.count_files)
         return {"file_count": count}
     except FolderError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/count_files_with_extension/")
-def count_files_with_extension(operation: ExtensionOperation, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
+@router.post("/count_files_with_extension", response_model=None, openapi_extra=extension_body.openapi_extra)
+async def count_files_with_extension(username: str = Depends(check_auth), operation: ExtensionOperation = Depends(extension_body)):
+    folder = _folder(operation.path)
+    loop = asyncio.get_running_loop()
     try:
-        count = folder.count_files_with_extension(operation.extension)
+        count = await loop.run_in_executor(None, folder.count_files_with_extension, operation.extension)
         return {"file_count": count}
     except FolderError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/create_file/")
-def create_file(operation: PathOperation, request: CreateFileRequest, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
+@router.post("/create_file", response_model=None, openapi_extra=create_file_body.openapi_extra)
+async def create_file(username: str = Depends(check_auth), body: CreateFileBody = Depends(create_file_body)):
+    operation, request = body.operation, body.request
+    folder = _folder(operation.path)
+    loop = asyncio.get_running_loop()
     try:
-        if folder.create_file(request.file_name, request.content):
-            return {"message": f"File '{request.file_name}' created successfully"}
+        if await loop.run_in_executor(None, folder.create_file, request.file_name, request.content):
+            return json_response(orjson.dumps({"message": f"File '{request.file_name}' created successfully"}))
     except FolderError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        _invalidate_exists(("file", folder.path, request.file_name))
 
-@app.post("/delete_file/")
-def delete_file(operation: FileOperation, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
+@router.post("/delete_file", response_model=None, openapi_extra=file_body.openapi_extra)
+async def delete_file(username: str = Depends(check_auth), operation: FileOperation = Depends(file_body)):
+    folder = _folder(operation.path)
+    loop = asyncio.get_running_loop()
     try:
-        if folder.delete_file(operation.file_name):
-            return {"message": f"File '{operation.file_name}' deleted successfully"}
+        if await loop.run_in_executor(None, folder.delete_file, operation.file_name):
+            return json_response(orjson.dumps({"message": f"File '{operation.file_name}' deleted successfully"}))
     except FolderError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        _invalidate_exists(("file", folder.path, operation.file_name))
 
-@app.post("/delete_folder/")
-def delete_folder(operation: PathOperation, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
+@router.post("/delete_folder", response_model=None, openapi_extra=path_body.openapi_extra)
+async def delete_folder(username: str = Depends(check_auth), operation: PathOperation = Depends(path_body)):
+    folder = _folder(operation.path)
+    loop = asyncio.get_running_loop()
     try:
-        if folder.delete_folder():
-            return {"message": f"Folder '{operation.path}' deleted successfully"}
+        if await loop.run_in_executor(None, folder.delete_folder):
+            return json_response(orjson.dumps({"message": f"Folder '{operation.path}' deleted successfully"}))
     except FolderError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        _invalidate_exists()
 
-@app.post("/folder_exists/")
-def folder_exists(operation: PathOperation, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
-    return {"exists": folder.folder_exists()}
-
-@app.post("/file_exists/")
-def file_exists(operation: FileOperation, username: str = Depends(get_current_username)):
-    folder = Folder(operation.path)
-    return {"exists": folder.file_exists(operation.file_name)}
+@router.post("/folder_exists", response_model=None, openapi_extra=path_body.openapi_extra)
+async def folder_exists(username: str = Depends(check_auth), operation: PathOperation = Depends(path_body)):
+    folder = _folder(operation.path)
+    key = ("f", folder.path)
+    try:
+        return json_response(EXISTS[_exists_cache[key]])
+    except KeyError:
+        generation = _exists_generation
+        loop = asyncio.get_running_loop()
+        exists = await loop.run_in_executor(None, folder.folder_exists)
+        if generation == _exists_generation:
+            _exists_cache[key] = exists
+        return json_response(EXISTS[exists])
+
+@router.post("/file_exists", response_model=None, openapi_extra=file_body.openapi_extra)
+async def file_exists(username: str = Depends(check_auth), operation: FileOperation = Depends(file_body)):
+    folder = _folder(operation.path)
+    key = ("file", folder.path, operation.file_name)
+    try:
+        return json_response(EXISTS[_exists_cache[key]])
+    except KeyError:
+        generation = _exists_generation
+        loop = asyncio.get_running_loop()
+        exists = await loop.run_in_executor(None, folder.file_exists, operation.file_name)
+        if generation == _exists_generation:
+            _exists_cache[key] = exists
+        return json_response(EXISTS[exists])
+
+def _batch_op(folder: Folder, op: BatchOp):
+    if op.op in ("create_file", "delete_file", "file_exists") and op.file_name is None:
+        raise ValueError(f"'file_name' is required for {op.op}")
+    if op.op in ("list_files_with_extension", "count_files_with_extension") and op.extension is None:
+        raise ValueError(f"'extension' is required for {op.op}")
+
+    if op.op == "create_folder":
+        folder.create_folder()
+        return {"message": "Folder created successfully"}
+    if op.op == "delete_folder":
+        folder.delete_folder()
+        return {"message": f"Folder '{op.path}' deleted successfully"}
+    if op.op == "folder_exists":
+        return {"exists": folder.folder_exists()}
+    if op.op == "list_files":
+        return {"files": folder.list_files()}
+    if op.op == "list_files_with_extension":
+        return {"files": folder.list_files_with_extension(op.extension)}
+    if op.op == "count_files":
+        return {"file_count": folder.count_files()}
+    if op.op == "count_files_with_extension":
+        return {"file_count": folder.count_files_with_extension(op.extension)}
+    if op.op == "create_file":
+        folder.create_file(op.file_name, op.content)
+        return {"message": f"File '{op.file_name}' created successfully"}
+    if op.op == "delete_file":
+        folder.delete_file(op.file_name)
+        return {"message": f"File '{op.file_name}' deleted successfully"}
+    return {"exists": folder.file_exists(op.file_name)}
+
+def _run_batch(jobs):
+    # Runs in a worker thread so the whole batch costs a single executor hop
+    results = []
+    for folder, op in jobs:
+        try:
+            results.append(_batch_op(folder, op))
+        except (FolderError, ValueError) as e:
+            results.append({"error": str(e)})
+        except Exception as e:
+            # Keep going so one bad item can't hide what earlier items did
+            logger.exception("Unexpected error in batch operation %s on %s", op.op, op.path)
+            results.append({"error": f"Unexpected error: {e}"})
+    return results
+
+@router.post("/batch", response_model=None, openapi_extra=batch_body.openapi_extra)
+async def batch(username: str = Depends(check_auth), ops: List[BatchOp] = Depends(batch_body)):
+    # Operations run in request order
+    jobs = [(_folder(op.path), op) for op in ops]
+
+    loop = asyncio.get_running_loop()
+    try:
+        results = await loop.run_in_executor(None, _run_batch, jobs)
+    finally:
+        for folder, op in jobs:
+            if op.op in ("create_folder", "delete_folder"):
+                _invalidate_exists()
+            elif op.op in ("create_file", "delete_file"):
+                _invalidate_exists(("file", folder.path, op.file_name))
+    return {"results": results}
+
+app.include_router(router)
+
+# check_auth reads the Authorization header by hand, so FastAPI does not know
+# about the Basic scheme; declare it so /docs offers an Authorize button
+default_openapi = app.openapi
+
+def openapi():
+    if app.openapi_schema is None:
+        schema = default_openapi()
+        schema.setdefault("components", {})["securitySchemes"] = {"basic": {"type": "http", "scheme": "basic"}}
+        for route in router.routes:
+            if isinstance(route, APIRoute) and any(dep.call is check_auth for dep in route.dependant.dependencies):
+                for method in route.methods:
+                    schema["paths"][route.path_format][method.lower()]["security"] = [{"basic": []}]
+    return app.openapi_schema
+
+app.openapi = openapi
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    from folder_manager_api.__main__ import main
+    main()
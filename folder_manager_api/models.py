@@ -0,0 +1,35 @@
+# models.py
+
+import msgspec
+from typing import Optional, Literal
+
+class CreateFileRequest(msgspec.Struct):
+    file_name: str
+    content: str = ""
+
+class PathOperation(msgspec.Struct):
+    path: str
+
+class FileOperation(msgspec.Struct):
+    path: str
+    file_name: str
+
+class ExtensionOperation(msgspec.Struct):
+    path: str
+    extension: str
+
+class CreateFileBody(msgspec.Struct):
+    operation: PathOperation
+    request: CreateFileRequest
+
+class BatchOp(msgspec.Struct):
+    op: Literal[
+        "create_folder", "delete_folder", "folder_exists",
+        "list_files", "list_files_with_extension",
+        "count_files", "count_files_with_extension",
+        "create_file", "delete_file", "file_exists",
+    ]
+    path: str
+    file_name: Optional[str] = None
+    content: str = ""
+    extension: Optional[str] = None
@@ -1,5 +1,21 @@
 from setuptools import setup, find_packages
 
+# Compile the request models and the endpoint module with Cython when it is
+# available; the pure Python modules are still shipped and used as a
+# fallback otherwise. The extensions are optional, so a missing or failing
+# C compiler skips them with a warning instead of failing the install.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["folder_manager_api/models.py", "folder_manager_api/folder_manager_api.py"],
+        language_level=3,
+        compiler_directives={"boundscheck": False, "wraparound": False, "annotation_typing": False},
+    )
+    for ext in ext_modules:
+        ext.optional = True
+except ImportError:
+    ext_modules = []
+
 setup(
     name="folder_manager_api",
     version="1.0.1",
@@ -9,11 +25,18 @@ setup(
     author="Javer Valino",
     url="https://github.com/phintegrator/folder_manager_api",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "fastapi",
         "fastapi-cors",
         "uvicorn",
-        "pydantic",
+        "gunicorn; sys_platform != 'win32'",
+        "uvloop; sys_platform != 'win32' and sys_platform != 'cygwin' and platform_python_implementation != 'PyPy'",
+        "httptools",
+        "msgspec",
+        "cachetools",
+        "orjson",
+        "anyio",
         "folder_manager",
     ],
     entry_points={
@@ -0,0 +1,21 @@
+import os
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def app_module(tmp_path_factory):
+    # The app writes its default config and log file to the working directory
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("app"))
+    try:
+        yield importlib.import_module("folder_manager_api.folder_manager_api")
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="session")
+def client(app_module):
+    return TestClient(app_module.app)
@@ -0,0 +1,73 @@
+import base64
+
+import pytest
+
+
+POST_ROUTES = [
+    "/create_folder",
+    "/list_files",
+    "/list_files_with_extension",
+    "/count_files",
+    "/count_files_with_extension",
+    "/create_file",
+    "/delete_file",
+    "/delete_folder",
+    "/folder_exists",
+    "/file_exists",
+    "/batch",
+]
+
+BODIES = [b"", b"{", b'{"nope": 1}', b'[{"op": "x"}]']
+
+
+@pytest.mark.parametrize("route", POST_ROUTES)
+@pytest.mark.parametrize("body", BODIES)
+def test_missing_authorization_is_rejected_before_body(client, route, body):
+    response = client.post(route, content=body)
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Not authenticated"}
+    assert response.headers["www-authenticate"] == "Basic"
+
+
+@pytest.mark.parametrize("route", POST_ROUTES)
+@pytest.mark.parametrize("body", BODIES)
+def test_wrong_credentials_are_rejected_before_body(client, route, body):
+    response = client.post(route, content=body, auth=("admin", "wrong"))
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Incorrect username or password"}
+
+
+def test_valid_credentials_reach_body_validation(client):
+    response = client.post("/list_files", content=b'{"nope": 1}', auth=("admin", "password"))
+    assert response.status_code == 422
+
+
+def test_request_bodies_are_documented(client):
+    paths = client.get("/openapi.json").json()["paths"]
+    for route in POST_ROUTES:
+        schema = paths[route]["post"]["requestBody"]["content"]["application/json"]["schema"]
+        assert "$ref" not in str(schema)
+    list_files = paths["/list_files"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    assert list_files["required"] == ["path"]
+
+
+@pytest.mark.parametrize("scheme", ["Basic", "basic", "BASIC"])
+def test_basic_scheme_is_case_insensitive(client, scheme):
+    credentials = base64.b64encode(b"admin:password").decode()
+    response = client.post("/list_files", content=b'{"nope": 1}', headers={"Authorization": f"{scheme} {credentials}"})
+    assert response.status_code == 422
+
+
+def test_other_schemes_are_not_authenticated(client):
+    credentials = base64.b64encode(b"admin:password").decode()
+    response = client.post("/list_files", content=b'{"path": "."}', headers={"Authorization": f"Bearer {credentials}"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Not authenticated"}
+
+
+def test_basic_scheme_is_declared_in_openapi(client):
+    schema = client.get("/openapi.json").json()
+    assert schema["components"]["securitySchemes"] == {"basic": {"type": "http", "scheme": "basic"}}
+    for route in POST_ROUTES:
+        assert schema["paths"][route]["post"]["security"] == [{"basic": []}]
+    assert "security" not in schema["paths"]["/"]["get"]
@@ -0,0 +1,32 @@
+from folder_manager import Folder
+
+AUTH = ("admin", "password")
+
+
+def test_null_content_is_rejected_before_any_operation_runs(client, tmp_path):
+    target = tmp_path / "created"
+    response = client.post("/batch", auth=AUTH, json=[
+        {"op": "create_folder", "path": str(target)},
+        {"op": "create_file", "path": str(target), "file_name": "a.txt", "content": None},
+    ])
+    assert response.status_code == 422
+    assert not target.exists()
+
+
+def test_unexpected_error_keeps_earlier_results(client, tmp_path, monkeypatch):
+    def broken(self, file_name, content=""):
+        raise TypeError("boom")
+
+    monkeypatch.setattr(Folder, "create_file", broken)
+    target = tmp_path / "created"
+    response = client.post("/batch", auth=AUTH, json=[
+        {"op": "create_folder", "path": str(target)},
+        {"op": "create_file", "path": str(target), "file_name": "a.txt"},
+        {"op": "folder_exists", "path": str(target)},
+    ])
+    assert response.status_code == 200
+    assert response.json() == {"results": [
+        {"message": "Folder created successfully"},
+        {"error": "Unexpected error: boom"},
+        {"exists": True},
+    ]}
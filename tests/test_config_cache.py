@@ -0,0 +1,65 @@
+import json
+import os
+
+import pytest
+
+CONFIG = "[server]\nport = 8000\n\n[auth]\nusername = admin\npassword = {password}\n\n[logging]\nlog_size = 1024\n"
+
+
+@pytest.fixture
+def paths(tmp_path):
+    config_file = tmp_path / "folder_manager_api.config"
+    config_file.write_text(CONFIG.format(password="oldpass"))
+    return str(config_file), str(tmp_path / "folder_manager_api.config.cache")
+
+
+def test_cache_is_written_privately_and_reused(app_module, paths):
+    config_file, config_cache = paths
+    assert app_module.load_settings(config_file, config_cache)["password"] == "oldpass"
+    assert os.stat(config_cache).st_mode & 0o777 == 0o600
+
+    # A hit returns the cached values without re-reading the config
+    with open(config_cache) as cachefile:
+        cached = json.load(cachefile)
+    cached["settings"]["port"] = 9000
+    with open(config_cache, "w") as cachefile:
+        json.dump(cached, cachefile)
+    assert app_module.load_settings(config_file, config_cache)["port"] == 9000
+
+
+def test_replaced_config_with_older_mtime_invalidates_cache(app_module, paths, tmp_path):
+    config_file, config_cache = paths
+    app_module.load_settings(config_file, config_cache)
+
+    # Like `cp -p`: new content, but an mtime older than the cache
+    replacement = tmp_path / "replacement"
+    replacement.write_text(CONFIG.format(password="NEWPASS"))
+    old = os.stat(config_cache).st_mtime_ns - 10**9
+    os.utime(replacement, ns=(old, old))
+    os.replace(replacement, config_file)
+
+    assert app_module.load_settings(config_file, config_cache)["password"] == "NEWPASS"
+
+
+@pytest.mark.parametrize("content", ["{}", "[1]", "not json", '{"source": {}, "settings": {"port": "x"}}'])
+def test_malformed_cache_falls_back_to_config(app_module, paths, content):
+    config_file, config_cache = paths
+    with open(config_cache, "w") as cachefile:
+        cachefile.write(content)
+    os.chmod(config_cache, 0o600)
+    assert app_module.load_settings(config_file, config_cache)["password"] == "oldpass"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions only")
+def test_world_readable_cache_is_rebuilt(app_module, paths):
+    config_file, config_cache = paths
+    app_module.load_settings(config_file, config_cache)
+    with open(config_cache) as cachefile:
+        cached = json.load(cachefile)
+    cached["settings"]["password"] = "stale"
+    with open(config_cache, "w") as cachefile:
+        json.dump(cached, cachefile)
+    os.chmod(config_cache, 0o644)
+
+    assert app_module.load_settings(config_file, config_cache)["password"] == "oldpass"
+    assert os.stat(config_cache).st_mode & 0o777 == 0o600
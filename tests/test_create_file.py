@@ -0,0 +1,25 @@
+AUTH = ("admin", "password")
+
+
+def test_null_content_is_rejected(client, tmp_path):
+    response = client.post("/create_file", auth=AUTH, json={
+        "operation": {"path": str(tmp_path)},
+        "request": {"file_name": "a.txt", "content": None},
+    })
+    assert response.status_code == 422
+    assert not (tmp_path / "a.txt").exists()
+
+
+def test_content_defaults_to_empty(client, tmp_path):
+    response = client.post("/create_file", auth=AUTH, json={
+        "operation": {"path": str(tmp_path)},
+        "request": {"file_name": "a.txt"},
+    })
+    assert response.status_code == 200
+    assert (tmp_path / "a.txt").read_text() == ""
+
+
+def test_content_schema_does_not_allow_null(client):
+    body = client.get("/openapi.json").json()["paths"]["/create_file"]["post"]["requestBody"]
+    content = body["content"]["application/json"]["schema"]["properties"]["request"]["properties"]["content"]
+    assert content == {"type": "string", "default": ""}
@@ -0,0 +1,62 @@
+from folder_manager import Folder
+
+AUTH = ("admin", "password")
+
+
+def exists(client, path, file_name=None):
+    if file_name is None:
+        response = client.post("/folder_exists", json={"path": str(path)}, auth=AUTH)
+    else:
+        response = client.post("/file_exists", json={"path": str(path), "file_name": file_name}, auth=AUTH)
+    assert response.status_code == 200
+    return response.json()["exists"]
+
+
+def test_create_and_delete_file_invalidate(client, tmp_path):
+    assert exists(client, tmp_path, "a.txt") is False
+    client.post("/create_file", json={"operation": {"path": str(tmp_path)}, "request": {"file_name": "a.txt"}}, auth=AUTH)
+    assert exists(client, tmp_path, "a.txt") is True
+    client.post("/delete_file", json={"path": str(tmp_path), "file_name": "a.txt"}, auth=AUTH)
+    assert exists(client, tmp_path, "a.txt") is False
+
+
+def test_delete_folder_invalidates_files_beneath_it(client, tmp_path):
+    folder = tmp_path / "d"
+    folder.mkdir()
+    (folder / "b.txt").write_text("")
+    assert exists(client, folder, "b.txt") is True
+    assert exists(client, folder) is True
+    client.post("/delete_folder", json={"path": str(folder)}, auth=AUTH)
+    assert exists(client, folder, "b.txt") is False
+    assert exists(client, folder) is False
+
+
+def test_create_folder_invalidates_parents(client, tmp_path):
+    parent = tmp_path / "p"
+    assert exists(client, parent) is False
+    client.post("/create_folder", json={"path": str(parent / "child")}, auth=AUTH)
+    assert exists(client, parent) is True
+
+
+def test_batch_delete_folder_invalidates_files_beneath_it(client, tmp_path):
+    folder = tmp_path / "d"
+    folder.mkdir()
+    (folder / "b.txt").write_text("")
+    assert exists(client, folder, "b.txt") is True
+    client.post("/batch", json=[{"op": "delete_folder", "path": str(folder)}], auth=AUTH)
+    assert exists(client, folder, "b.txt") is False
+
+
+def test_check_racing_a_mutation_is_not_cached(client, app_module, tmp_path, monkeypatch):
+    folder = tmp_path / "d"
+    folder.mkdir()
+
+    def stale_folder_exists(self):
+        # A create finished while this check was reading the old state
+        app_module._invalidate_exists()
+        return False
+
+    monkeypatch.setattr(Folder, "folder_exists", stale_folder_exists)
+    assert exists(client, folder) is False
+    monkeypatch.undo()
+    assert exists(client, folder) is True